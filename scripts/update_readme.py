@@ -15,12 +15,20 @@ Requirements:
 
 import os
 import re
+import json
+import hashlib
 import time
 import logging
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
 from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +37,153 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Daily contribution counts for the last year
+CONTRIBUTIONS_QUERY = """
+query($login: String!) {
+    user(login: $login) {
+        contributionsCollection {
+            totalCommitContributions
+            contributionCalendar {
+                weeks {
+                    contributionDays {
+                        contributionCount
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+# On-disk state, restored between workflow runs by actions/cache
+CACHE_DIR = '.cache'
+STATS_HASH_PATH = os.path.join(CACHE_DIR, 'last_stats.sha')
+
+# README timestamp line rewritten on each run
+_TS_RE = re.compile(r'\*Last updated: .*?\*')
+
+# Numbers scraped from HackerRank profile text
+_RANK_RE = re.compile(r'#?(\d+)')
+_POINTS_RE = re.compile(r'(\d+)')
+
+# Candidate CSS selectors for each HackerRank profile field
+_HR_BADGE_SELECTOR = ', '.join([
+    'div.badge-item',
+    'div[class*="badge"]',
+    '.badge',
+    'div[data-test="badge"]',
+    '.certificate-item',
+    'div[class*="certificate"]'
+])
+_HR_RANK_SELECTOR = ', '.join([
+    'div.profile-rank',
+    'span[class*="rank"]',
+    '.rank',
+    'div[data-test="rank"]',
+    'span[class*="position"]',
+    '.position'
+])
+_HR_POINTS_SELECTOR = ', '.join([
+    'div[class*="point"]',
+    '.points',
+    'span[class*="point"]',
+    'div[data-test="points"]',
+    '.score'
+])
+_HR_SKILL_SELECTOR = ', '.join([
+    'div.skill-item',
+    'span.skill-name',
+    'div[class*="skill"]',
+    'span[class*="skill"]',
+    'div[data-test="skill"]',
+    '.skill-tag',
+    'div[class*="certificate"]'
+])
+
+# Number of languages listed under "Top Languages"
+TOP_LANGUAGES = 3
+
+# Pause until the rate limit resets once fewer requests than this remain
+# (or a tenth of the budget for resources with a smaller limit)
+RATE_LIMIT_THRESHOLD = 50
+# Retries after a rate-limited response, with exponential backoff
+RATE_LIMIT_RETRIES = 3
+
+# One page of up to 100 public, non-fork repositories owned by the user
+# with everything the stats need
+REPOSITORIES_QUERY = """
+query($login: String!, $userId: ID!, $cursor: String) {
+    user(login: $login) {
+        repositories(first: 100, after: $cursor, privacy: PUBLIC, ownerAffiliations: OWNER, isFork: false) {
+            nodes {
+                name
+                stargazerCount
+                primaryLanguage {
+                    name
+                }
+                languages(first: 10, orderBy: {field: SIZE, direction: DESC}) {
+                    edges {
+                        size
+                        node {
+                            name
+                        }
+                    }
+                }
+                defaultBranchRef {
+                    target {
+                        ... on Commit {
+                            history(author: {id: $userId}) {
+                                totalCount
+                            }
+                        }
+                    }
+                }
+            }
+            pageInfo {
+                endCursor
+                hasNextPage
+            }
+        }
+    }
+}
+"""
+
+
+def _retry_after_seconds(value: str) -> Optional[float]:
+    """Parse a Retry-After header given as delay-seconds or an HTTP-date"""
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _create_session(headers: Dict) -> requests.Session:
+    """Create a session with a pooled, retrying HTTPS adapter"""
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        # 429s are left to GitHubStatsCollector._send so rate limits are retried in one place;
+        # urllib3 would otherwise still retry any 429 carrying a Retry-After header
+        status_forcelist=[502, 503, 504],
+        # GraphQL queries are read-only, so POST is safe to retry too
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'POST'},
+        respect_retry_after_header=False,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=50, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.headers.update(headers)
+    return session
+
+
 class GitHubStatsCollector:
     """Collects GitHub statistics using the GitHub API"""
     
@@ -39,158 +194,229 @@ class GitHubStatsCollector:
             'Authorization': f'token {token}',
             'Accept': 'application/vnd.github.v3+json'
         }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        self.session = _create_session(self.headers)
+        self._user_id = None
+        # Rate limit state per X-RateLimit-Resource (core, graphql),
+        # since each has its own budget and reset time
+        self._rate_limits: Dict[str, Dict[str, Optional[int]]] = {}
     
-    def _make_request(self, url: str, params: Dict = None) -> Optional[Dict]:
-        """Make a request to the GitHub API with error handling"""
-        try:
-            response = self.session.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed for {url}: {e}")
-            return None
+    @staticmethod
+    def _resource_for(url: str) -> str:
+        """Guess which rate limit resource a request to this URL counts against"""
+        if url.endswith('/graphql'):
+            return 'graphql'
+        return 'core'
     
-    def get_user_info(self) -> Dict:
-        """Get basic user information"""
-        logger.info("Fetching user information...")
-        url = f"https://api.github.com/users/{self.username}"
-        return self._make_request(url) or {}
-    
-    def get_repositories(self) -> List[Dict]:
-        """Get all repositories for the user"""
-        logger.info("Fetching repositories...")
-        repos = []
-        page = 1
-        
-        while True:
-            url = f"https://api.github.com/users/{self.username}/repos"
-            params = {
-                'page': page,
-                'per_page': 100,
-                'type': 'all',
-                'sort': 'updated'
+    def _update_rate_limit(self, resource: str, response: requests.Response):
+        """Record the rate limit budget reported by GitHub"""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is not None and reset is not None:
+            resource = response.headers.get('X-RateLimit-Resource', resource)
+            limit = response.headers.get('X-RateLimit-Limit')
+            self._rate_limits[resource] = {
+                'remaining': int(remaining),
+                'reset': int(reset),
+                'limit': int(limit) if limit else None,
             }
+    
+    def _wait_for_reset(self, resource: str):
+        """Sleep until the rate limit window for a resource resets"""
+        state = self._rate_limits.pop(resource, {})
+        reset = state.get('reset')
+        wait = max(0, reset - time.time()) if reset else 60
+        logger.warning(f"{resource} rate limit low ({state.get('remaining')} remaining), sleeping {wait:.0f}s until reset")
+        time.sleep(wait)
+    
+    def _throttle(self, resource: str):
+        """Sleep until the rate limit resets if the resource's remaining budget is low"""
+        state = self._rate_limits.get(resource)
+        if state is None:
+            return
+        threshold = RATE_LIMIT_THRESHOLD
+        if state['limit']:
+            threshold = min(threshold, state['limit'] // 10)
+        if state['remaining'] < threshold:
+            self._wait_for_reset(resource)
+    
+    def _is_rate_limited(self, response: requests.Response) -> bool:
+        """Check whether a response was rejected by the primary or secondary rate limit"""
+        if response.status_code == 429:
+            return True
+        return response.status_code == 403 and (
+            'Retry-After' in response.headers
+            or response.headers.get('X-RateLimit-Remaining') == '0'
+            or 'rate limit' in response.text.lower()
+        )
+    
+    def _send(self, method: str, url: str, **kwargs) -> Optional[requests.Response]:
+        """Send a request, backing off and retrying while GitHub rate limits it"""
+        resource = self._resource_for(url)
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self._throttle(resource)
+            try:
+                response = self.session.request(method, url, timeout=30, **kwargs)
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Request failed for {url}: {e}")
+                return None
+            self._update_rate_limit(resource, response)
             
-            data = self._make_request(url, params)
-            if not data:
+            if not self._is_rate_limited(response):
+                return response
+            if attempt == RATE_LIMIT_RETRIES:
                 break
-                
-            repos.extend(data)
             
-            if len(data) < 100:  # Last page
-                break
-                
-            page += 1
-            time.sleep(0.1)  # Rate limiting
+            retry_after = _retry_after_seconds(response.headers.get('Retry-After', ''))
+            if retry_after is not None:
+                # Secondary rate limits say exactly how long to wait
+                wait = retry_after
+            elif self._rate_limits.get(resource, {}).get('remaining') == 0:
+                self._wait_for_reset(resource)
+                continue
+            else:
+                wait = 2 ** attempt  # 1s, 2s, 4s
+            logger.warning(f"Rate limited on {url}, retrying in {wait:.0f}s")
+            time.sleep(wait)
         
-        logger.info(f"Found {len(repos)} repositories")
-        return repos
+        logger.warning(f"Rate limit still exceeded for {url}")
+        return None
     
-    def get_total_commits(self) -> int:
-        """Get total commit count across all repositories"""
-        logger.info("Calculating total commits...")
-        repos = self.get_repositories()
-        total_commits = 0
+    def _graphql(self, query: str, variables: Dict = None) -> Optional[Dict]:
+        """Run a query against the GitHub GraphQL API with error handling"""
+        url = "https://api.github.com/graphql"
+        response = self._send('POST', url, json={'query': query, 'variables': variables or {}})
+        if response is None:
+            return None
         
-        for repo in repos:
-            if repo['fork']:  # Skip forked repositories
-                continue
-                
-            # Get commits for this repository
-            url = f"https://api.github.com/repos/{self.username}/{repo['name']}/commits"
-            params = {
-                'author': self.username,
-                'per_page': 1
-            }
+        if not response.ok:
+            logger.warning(f"GraphQL request failed: HTTP {response.status_code}")
+            return None
+        
+        try:
+            data = response.json()
+        except ValueError as e:
+            logger.error(f"Invalid JSON from GraphQL API: {e}")
+            return None
+        
+        if data.get('errors'):
+            logger.error(f"GraphQL query returned errors: {data['errors']}")
+            return None
+        return data.get('data')
+    
+    def _get_user_id(self) -> Optional[str]:
+        """Get the user's GraphQL node ID, used to filter commit history by author"""
+        if self._user_id is None:
+            data = self._graphql(
+                "query($login: String!) { user(login: $login) { id } }",
+                {'login': self.username}
+            )
+            if data and data.get('user'):
+                self._user_id = data['user']['id']
+        return self._user_id
+    
+    def _own_repos(self) -> Optional[List[Dict]]:
+        """Get the user's own public repositories, excluding forks, with their stats"""
+        user_id = self._get_user_id()
+        if not user_id:
+            logger.error(f"Could not resolve GitHub user {self.username}")
+            return None
+        
+        nodes = []
+        cursor = None
+        while True:
+            data = self._graphql(REPOSITORIES_QUERY, {
+                'login': self.username,
+                'userId': user_id,
+                'cursor': cursor
+            })
+            if not data or not data.get('user'):
+                # A missing page would silently undercount every stat
+                logger.error(f"Could not fetch repositories for {self.username}")
+                return None
             
-            try:
-                response = self.session.get(url, params=params, timeout=30)
-                if response.status_code == 200:
-                    # Get total count from Link header
-                    link_header = response.headers.get('Link', '')
-                    if 'rel="last"' in link_header:
-                        last_page = re.search(r'page=(\d+).*rel="last"', link_header)
-                        if last_page:
-                            commits_count = int(last_page.group(1))
-                            total_commits += commits_count
-                            logger.info(f"Repository {repo['name']}: {commits_count} commits")
-                    else:
-                        # If no pagination, count the commits directly
-                        commits = response.json()
-                        if commits:
-                            commits_count = len(commits)
-                            total_commits += commits_count
-                            logger.info(f"Repository {repo['name']}: {commits_count} commits")
-                elif response.status_code == 409:
-                    # Repository is empty
-                    logger.info(f"Repository {repo['name']}: Empty repository")
-                else:
-                    logger.warning(f"Could not get commits for {repo['name']}: HTTP {response.status_code}")
-            except Exception as e:
-                logger.warning(f"Could not get commits for {repo['name']}: {e}")
-                continue
+            repositories = data['user']['repositories']
+            nodes.extend(repositories['nodes'])
             
-            time.sleep(0.1)  # Rate limiting
+            page_info = repositories['pageInfo']
+            if not page_info['hasNextPage']:
+                break
+            cursor = page_info['endCursor']
         
-        logger.info(f"Total commits: {total_commits}")
-        return total_commits
+        return nodes
     
-    def get_total_stars(self) -> int:
-        """Get total stars across all repositories"""
-        logger.info("Calculating total stars...")
-        repos = self.get_repositories()
+    def collect_all(self) -> Dict:
+        """Get total commits, total stars and language usage in batched GraphQL queries"""
+        logger.info("Collecting repository stats via GraphQL...")
+        total_commits = 0
         total_stars = 0
+        language_stats = Counter()
         
-        for repo in repos:
-            if not repo['fork']:  # Only count original repositories
-                stars = repo.get('stargazers_count', 0)
-                total_stars += stars
-                if stars > 0:
-                    logger.info(f"Repository {repo['name']}: {stars} stars")
-        
-        logger.info(f"Total stars: {total_stars}")
-        return total_stars
-    
-    def get_language_stats(self) -> Dict[str, int]:
-        """Get programming language statistics"""
-        logger.info("Analyzing language usage...")
-        repos = self.get_repositories()
-        language_stats = {}
+        repos = self._own_repos()
+        if repos is None:
+            raise RuntimeError(f"Could not fetch repositories for {self.username}")
         
         for repo in repos:
-            if repo['fork']:  # Skip forked repositories
-                continue
-                
-            # Get detailed language stats for this repo
-            url = f"https://api.github.com/repos/{self.username}/{repo['name']}/languages"
-            languages = self._make_request(url)
-            
-            if languages:
-                for lang, bytes_count in languages.items():
-                    language_stats[lang] = language_stats.get(lang, 0) + bytes_count
-                    logger.info(f"Repository {repo['name']}: {lang} ({bytes_count} bytes)")
+            # Commits on the default branch (None for empty repositories)
+            branch = repo.get('defaultBranchRef')
+            if branch and branch['target']:
+                commits_count = branch['target']['history']['totalCount']
+                total_commits += commits_count
+                logger.info("Repository %s: %d commits", repo['name'], commits_count)
             else:
-                # If no detailed language stats, use the primary language
-                primary_lang = repo.get('language')
-                if primary_lang:
-                    language_stats[primary_lang] = language_stats.get(primary_lang, 0) + 1000  # Default weight
-                    logger.info(f"Repository {repo['name']}: {primary_lang} (primary language)")
+                logger.info("Repository %s: Empty repository", repo['name'])
             
-            time.sleep(0.1)  # Rate limiting
+            stars = repo['stargazerCount']
+            total_stars += stars
+            if stars > 0:
+                logger.info("Repository %s: %d stars", repo['name'], stars)
+            
+            edges = repo['languages']['edges']
+            if edges:
+                language_stats.update({edge['node']['name']: edge['size'] for edge in edges})
+            elif repo.get('primaryLanguage'):
+                # If no detailed language stats, use the primary language
+                language_stats[repo['primaryLanguage']['name']] += 1000  # Default weight
         
-        # Sort by usage
-        sorted_languages = dict(sorted(language_stats.items(), key=lambda x: x[1], reverse=True))
-        logger.info(f"Found {len(sorted_languages)} languages: {list(sorted_languages.keys())}")
-        return sorted_languages
+        # Only the most used languages are shown in the README
+        top_languages = dict(language_stats.most_common(TOP_LANGUAGES))
+        logger.info(f"Total commits: {total_commits}")
+        logger.info(f"Total stars: {total_stars}")
+        logger.info(f"Language usage (bytes): {dict(language_stats)}")
+        logger.info(f"Found {len(language_stats)} languages, top: {list(top_languages.keys())}")
+        return {
+            'total_commits': total_commits,
+            'total_stars': total_stars,
+            'languages': top_languages,
+            'contribution_streak': self.get_contribution_streak()
+        }
     
     def get_contribution_streak(self) -> int:
-        """Get current contribution streak (simplified version)"""
+        """Get current contribution streak from the last year's contribution calendar"""
         logger.info("Calculating contribution streak...")
-        # Note: This would require scraping the contribution graph or using GitHub GraphQL API
-        # For now, return a placeholder
-        return 0
+        data = self._graphql(CONTRIBUTIONS_QUERY, {'login': self.username})
+        if not data or not data.get('user'):
+            return 0
+        
+        contributions = data['user']['contributionsCollection']
+        logger.info(f"Commit contributions in the last year: {contributions['totalCommitContributions']}")
+        
+        days = [
+            day['contributionCount']
+            for week in contributions['contributionCalendar']['weeks']
+            for day in week['contributionDays']
+        ]
+        # Today may not have contributions yet, which doesn't break the streak
+        if days and days[-1] == 0:
+            days.pop()
+        
+        streak = 0
+        for count in reversed(days):
+            if count == 0:
+                break
+            streak += 1
+        
+        logger.info(f"Current streak: {streak} days")
+        return streak
     
 
 
@@ -199,8 +425,7 @@ class LeetCodeStatsCollector:
     
     def __init__(self, username: str):
         self.username = username
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = _create_session({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
     
@@ -279,8 +504,7 @@ class HackerRankStatsCollector:
     
     def __init__(self, username: str):
         self.username = username
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = _create_session({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
     
@@ -293,7 +517,7 @@ class HackerRankStatsCollector:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = LexborHTMLParser(response.text)
             
             stats = {
                 'badges': 0,
@@ -302,89 +526,42 @@ class HackerRankStatsCollector:
                 'skills': []
             }
             
-            # Try multiple selectors for badges
-            badge_selectors = [
-                'div.badge-item',
-                'div[class*="badge"]',
-                '.badge',
-                'div[data-test="badge"]',
-                '.certificate-item',
-                'div[class*="certificate"]'
-            ]
+            # Each field's candidate selectors are combined so the tree is walked once per field.
+            # lexbor repeats a node once per selector it matches, so dedupe before counting.
+            badge_elements = list(dict.fromkeys(tree.css(_HR_BADGE_SELECTOR)))
+            if badge_elements:
+                stats['badges'] = len(badge_elements)
+                logger.info(f"Found {stats['badges']} badges")
             
-            for selector in badge_selectors:
-                badge_elements = soup.select(selector)
-                if badge_elements:
-                    stats['badges'] = len(badge_elements)
-                    logger.info(f"Found {stats['badges']} badges using selector: {selector}")
+            for rank_element in tree.css(_HR_RANK_SELECTOR):
+                rank_text = rank_element.text(strip=True)
+                # Extract rank number if present
+                rank_match = _RANK_RE.search(rank_text)
+                if rank_match:
+                    stats['rank'] = int(rank_match.group(1))
+                    logger.info(f"Found rank: {stats['rank']}")
                     break
             
-            # Try multiple selectors for rank
-            rank_selectors = [
-                'div.profile-rank',
-                'span[class*="rank"]',
-                '.rank',
-                'div[data-test="rank"]',
-                'span[class*="position"]',
-                '.position'
-            ]
-            
-            for selector in rank_selectors:
-                rank_element = soup.select_one(selector)
-                if rank_element:
-                    rank_text = rank_element.get_text(strip=True)
-                    # Extract rank number if present
-                    rank_match = re.search(r'#?(\d+)', rank_text)
-                    if rank_match:
-                        stats['rank'] = int(rank_match.group(1))
-                        logger.info(f"Found rank: {stats['rank']} using selector: {selector}")
-                        break
-            
-            # Try multiple selectors for points
-            points_selectors = [
-                'div[class*="point"]',
-                '.points',
-                'span[class*="point"]',
-                'div[data-test="points"]',
-                '.score'
-            ]
-            
-            for selector in points_selectors:
-                points_element = soup.select_one(selector)
-                if points_element:
-                    points_text = points_element.get_text(strip=True)
-                    points_match = re.search(r'(\d+)', points_text)
-                    if points_match:
-                        stats['points'] = int(points_match.group(1))
-                        logger.info(f"Found points: {stats['points']} using selector: {selector}")
-                        break
-            
-            # Try multiple selectors for skills
-            skill_selectors = [
-                'div.skill-item',
-                'span.skill-name',
-                'div[class*="skill"]',
-                'span[class*="skill"]',
-                'div[data-test="skill"]',
-                '.skill-tag',
-                'div[class*="certificate"]'
-            ]
+            for points_element in tree.css(_HR_POINTS_SELECTOR):
+                points_text = points_element.text(strip=True)
+                points_match = _POINTS_RE.search(points_text)
+                if points_match:
+                    stats['points'] = int(points_match.group(1))
+                    logger.info(f"Found points: {stats['points']}")
+                    break
             
-            for selector in skill_selectors:
-                skill_elements = soup.select(selector)
-                if skill_elements:
-                    skills = [skill.get_text(strip=True) for skill in skill_elements[:5]]
-                    # Filter out empty skills and common non-skill text
-                    skills = [skill for skill in skills if skill and len(skill) > 2 and skill not in ['Badges', 'Certificates', 'Skills']]
-                    if skills:
-                        stats['skills'] = skills
-                        logger.info(f"Found skills: {stats['skills']} using selector: {selector}")
-                        break
+            # Dedupe by text, since nested skill elements can match more than one selector
+            skills = dict.fromkeys(skill.text(strip=True) for skill in tree.css(_HR_SKILL_SELECTOR))
+            # Filter out empty skills and common non-skill text
+            skills = [skill for skill in skills if skill and len(skill) > 2 and skill not in ['Badges', 'Certificates', 'Skills']]
+            if skills:
+                stats['skills'] = skills[:5]
+                logger.info(f"Found skills: {stats['skills']}")
             
             # If no skills found, try to extract from any text that might contain skill names
             if not stats['skills']:
                 # Look for common programming languages/technologies
-                page_text = soup.get_text().lower()
+                page_text = tree.root.text().lower() if tree.root else ''
                 common_skills = ['python', 'java', 'javascript', 'c++', 'sql', 'algorithms', 'data structures', 'problem solving']
                 found_skills = [skill.title() for skill in common_skills if skill in page_text]
                 if found_skills:
@@ -399,38 +576,48 @@ class HackerRankStatsCollector:
             return {}
 
 
-class READMEUpdater:
-    """Updates the README.md file with collected statistics"""
-    
-    def __init__(self, readme_path: str = "README.md"):
-        self.readme_path = readme_path
-    
-    def update_readme(self, github_stats: Dict, leetcode_stats: Dict, hackerrank_stats: Dict):
-        """Update README.md with new statistics"""
-        logger.info("Updating README.md...")
-        
-        # Read current README
-        try:
-            with open(self.readme_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except FileNotFoundError:
-            logger.info("README.md not found, creating new one...")
-            content = self._get_template_content()
-        
-        # Update statistics
-        updated_content = self._replace_stats(content, github_stats, leetcode_stats, hackerrank_stats)
-        
-        # Write updated content
-        with open(self.readme_path, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
-        
-        logger.info("README.md updated successfully!")
+def _replace_sections(content: str, sections: Dict[str, str]) -> str:
+    """Replace the text between each <!-- {tag}_STATS_START/END --> marker pair in one pass"""
+    spans = []
+    for tag, body in sections.items():
+        start = f'<!-- {tag}_STATS_START -->'
+        i = content.find(start)
+        if i == -1:
+            continue
+        i += len(start)
+        j = content.find(f'<!-- {tag}_STATS_END -->', i)
+        if j != -1:
+            spans.append((i, j, body))
     
-    def _get_template_content(self) -> str:
-        """Get template README content"""
-        username = os.getenv('GITHUB_USERNAME', 'your-username')
-        
-        return f"""# Hi there, I'm {username}! 👋
+    # Stitch untouched text and new bodies together in document order
+    parts = []
+    pos = 0
+    for i, j, body in sorted(spans):
+        parts.extend((content[pos:i], '\n', body, '\n'))
+        pos = j
+    parts.append(content[pos:])
+    return ''.join(parts)
+
+
+# Body of each README stats section, keyed by its marker tag and filled in with str.format_map
+_STATS_SECTIONS = {
+    'GITHUB': """- 🔥 **Total Commits:** {total_commits}
+- ⭐ **Total Stars:** {total_stars}  
+- 📚 **Top Languages:** {languages}
+- 📅 **Current Streak:** {contribution_streak} days""",
+    'LEETCODE': """- 📈 **Problems Solved:** {total_solved}
+- 🟢 **Easy:** {easy_solved}
+- 🟡 **Medium:** {medium_solved}  
+- 🔴 **Hard:** {hard_solved}
+- 🏆 **Ranking:** {ranking}""",
+    'HACKERRANK': """- 🏅 **Badges:** {badges}
+- 🎯 **Rank:** {rank}
+- 💎 **Skills:** {skills}
+- 📊 **Points:** {points}"""
+}
+
+# Starting point for a missing README, filled in with str.format
+_README_TEMPLATE = """# Hi there, I'm {username}! 👋
 
 [![Typing SVG](https://readme-typing-svg.herokuapp.com?font=Fira+Code&pause=1000&color=36BCF7&width=435&lines=Full+Stack+Developer;Open+Source+Enthusiast;Problem+Solver;Always+Learning)](https://git.io/typing-svg)
 
@@ -440,6 +627,7 @@ class READMEUpdater:
 - 🔥 **Total Commits:** 0
 - ⭐ **Total Stars:** 0  
 - 📚 **Top Languages:** Python, JavaScript, TypeScript
+- 📅 **Current Streak:** 0 days
 <!-- GITHUB_STATS_END -->
 
 ## 🧠 Coding Platforms
@@ -474,7 +662,7 @@ class READMEUpdater:
 
 ---
 
-*Last updated: {datetime.now().strftime('%B %d, %Y at %I:%M %p UTC')}*
+*Last updated: {timestamp}*
 
 ---
 
@@ -484,72 +672,175 @@ class READMEUpdater:
 
 </div>
 """
+
+TIMESTAMP_FORMAT = '%B %d, %Y at %I:%M %p UTC'
+
+
+class READMEUpdater:
+    """Updates the README.md file with collected statistics"""
     
-    def _replace_stats(self, content: str, github_stats: Dict, leetcode_stats: Dict, hackerrank_stats: Dict) -> str:
-        """Replace statistics in README content"""
+    def __init__(self, readme_path: str = "README.md"):
+        self.readme_path = readme_path
+    
+    def update_readme(self, github_stats: Dict, leetcode_stats: Dict, hackerrank_stats: Dict):
+        """Update README.md with new statistics"""
+        logger.info("Updating README.md...")
+        timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
         
-        # Format GitHub stats
-        top_languages = list(github_stats.get('languages', {}).keys())[:3]
-        languages_str = ', '.join(top_languages) if top_languages else 'Python, JavaScript, TypeScript'
+        stats = [github_stats, leetcode_stats, hackerrank_stats]
+        readme = Path(self.readme_path)
+        readme_exists = readme.exists()
         
-        github_section = f"""- 🔥 **Total Commits:** {github_stats.get('total_commits', 0):,}
-- ⭐ **Total Stars:** {github_stats.get('total_stars', 0):,}  
-- 📚 **Top Languages:** {languages_str}"""
+        # Read current README, or start from the template without touching disk
+        if readme_exists:
+            content = readme.read_text(encoding='utf-8')
+            # Nothing to render if neither the stats nor the README changed since the last write
+            if self._load_stats_hash() == self._stats_hash(stats, content):
+                logger.info("Stats and README unchanged since last run, skipping README update")
+                return
+        else:
+            logger.info("README.md not found, creating new one...")
+            content = self._get_template_content(timestamp)
         
-        # Format LeetCode stats
-        ranking = leetcode_stats.get('ranking', 'N/A')
-        if ranking and ranking != 'N/A':
-            ranking = f"#{ranking:,}"
+        # Update statistics
+        updated_content = self._replace_stats(content, github_stats, leetcode_stats, hackerrank_stats, timestamp)
         
-        leetcode_section = f"""- 📈 **Problems Solved:** {leetcode_stats.get('total_solved', 0):,}
-- 🟢 **Easy:** {leetcode_stats.get('easy_solved', 0):,}
-- 🟡 **Medium:** {leetcode_stats.get('medium_solved', 0):,}  
-- 🔴 **Hard:** {leetcode_stats.get('hard_solved', 0):,}
-- 🏆 **Ranking:** {ranking}"""
+        # Skip the write if only the timestamp would change
+        if readme_exists and _TS_RE.sub('', updated_content) == _TS_RE.sub('', content):
+            logger.info("README unchanged, skipping write")
+            self._save_stats_hash(self._stats_hash(stats, content))
+            return
         
-        # Format HackerRank stats
-        skills_str = ', '.join(hackerrank_stats.get('skills', ['Problem Solving', 'Algorithms'])[:3])
-        rank = hackerrank_stats.get('rank', 'N/A')
-        if rank and rank != 'N/A':
-            rank = f"#{rank:,}"
+        # Write to a temporary file and swap it in so a crash never leaves a half-written README
+        tmp = readme.with_suffix(readme.suffix + '.tmp')
+        tmp.write_text(updated_content, encoding='utf-8')
+        os.replace(tmp, readme)
+        self._save_stats_hash(self._stats_hash(stats, updated_content))
         
-        hackerrank_section = f"""- 🏅 **Badges:** {hackerrank_stats.get('badges', 0):,}
-- 🎯 **Rank:** {rank}
-- 💎 **Skills:** {skills_str}
-- 📊 **Points:** {hackerrank_stats.get('points', 0):,}"""
+        logger.info("README.md updated successfully!")
+    
+    def _stats_hash(self, stats: List[Dict], content: str) -> str:
+        """Hash the stats together with the README they were rendered into"""
+        # The README (minus its timestamp) and section templates are included so manual
+        # edits, reverts and template changes are re-rendered even when the stats are not new
+        payload = json.dumps([stats, _STATS_SECTIONS, _TS_RE.sub('', content)], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def _load_stats_hash(self) -> Optional[str]:
+        """Get the hash saved after the last README update"""
+        try:
+            return Path(STATS_HASH_PATH).read_text(encoding='utf-8').strip()
+        except OSError:
+            return None
+    
+    def _save_stats_hash(self, stats_hash: str):
+        """Remember the hash of the stats and the README they are now reflected in"""
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            Path(STATS_HASH_PATH).write_text(stats_hash, encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"Could not write {STATS_HASH_PATH}: {e}")
+    
+    def _get_template_content(self, timestamp: str) -> str:
+        """Get template README content"""
+        username = os.getenv('GITHUB_USERNAME', 'your-username')
         
-        # Replace sections using regex
-        content = re.sub(
-            r'<!-- GITHUB_STATS_START -->.*?<!-- GITHUB_STATS_END -->',
-            f'<!-- GITHUB_STATS_START -->\n{github_section}\n<!-- GITHUB_STATS_END -->',
-            content,
-            flags=re.DOTALL
-        )
+        return _README_TEMPLATE.format(username=username, timestamp=timestamp)
+    
+    def _replace_stats(self, content: str, github_stats: Dict, leetcode_stats: Dict, hackerrank_stats: Dict,
+                       timestamp: str) -> str:
+        """Replace statistics in README content"""
         
-        content = re.sub(
-            r'<!-- LEETCODE_STATS_START -->.*?<!-- LEETCODE_STATS_END -->',
-            f'<!-- LEETCODE_STATS_START -->\n{leetcode_section}\n<!-- LEETCODE_STATS_END -->',
-            content,
-            flags=re.DOTALL
-        )
+        # Placeholders without a value (e.g. no ranking yet) render as N/A
+        values = defaultdict(lambda: 'N/A')
         
-        content = re.sub(
-            r'<!-- HACKERRANK_STATS_START -->.*?<!-- HACKERRANK_STATS_END -->',
-            f'<!-- HACKERRANK_STATS_START -->\n{hackerrank_section}\n<!-- HACKERRANK_STATS_END -->',
-            content,
-            flags=re.DOTALL
-        )
+        # Format GitHub stats
+        top_languages = list(github_stats.get('languages', {}).keys())[:TOP_LANGUAGES]
+        values['languages'] = ', '.join(top_languages) if top_languages else 'Python, JavaScript, TypeScript'
+        values['total_commits'] = f"{github_stats.get('total_commits', 0):,}"
+        values['total_stars'] = f"{github_stats.get('total_stars', 0):,}"
+        values['contribution_streak'] = f"{github_stats.get('contribution_streak', 0):,}"
+        
+        # Format LeetCode stats
+        for key in ('total_solved', 'easy_solved', 'medium_solved', 'hard_solved'):
+            values[key] = f"{leetcode_stats.get(key, 0):,}"
+        if leetcode_stats.get('ranking'):
+            values['ranking'] = f"#{leetcode_stats['ranking']:,}"
+        
+        # Format HackerRank stats
+        values['skills'] = ', '.join(hackerrank_stats.get('skills', ['Problem Solving', 'Algorithms'])[:3])
+        values['badges'] = f"{hackerrank_stats.get('badges', 0):,}"
+        values['points'] = f"{hackerrank_stats.get('points', 0):,}"
+        if hackerrank_stats.get('rank'):
+            values['rank'] = f"#{hackerrank_stats['rank']:,}"
+        
+        # Replace the text between each pair of fixed section markers
+        content = _replace_sections(content, {
+            tag: template.format_map(values) for tag, template in _STATS_SECTIONS.items()
+        })
         
         # Update timestamp
-        content = re.sub(
-            r'\*Last updated: .*?\*',
-            f'*Last updated: {datetime.now().strftime("%B %d, %Y at %I:%M %p UTC")}*',
+        content = _TS_RE.sub(
+            f'*Last updated: {timestamp}*',
             content
         )
         
         return content
 
 
+def _collect_github(token: str, username: str) -> Dict:
+    """Collect GitHub stats, falling back to zeros on failure"""
+    logger.info(f"Collecting GitHub stats for user: {username}")
+    github_collector = GitHubStatsCollector(token, username)
+    
+    try:
+        github_stats = github_collector.collect_all()
+        logger.info(f"GitHub stats collected successfully: {github_stats}")
+    except Exception as e:
+        logger.error(f"Failed to collect GitHub stats: {e}")
+        github_stats = {
+            'total_commits': 0,
+            'total_stars': 0,
+            'languages': {},
+            'contribution_streak': 0
+        }
+    return github_stats
+
+
+def _collect_leetcode(username: Optional[str]) -> Dict:
+    """Collect LeetCode stats if a username is configured"""
+    if not username:
+        logger.warning("LEETCODE_USERNAME not provided, skipping LeetCode stats")
+        return {}
+    
+    logger.info(f"Collecting LeetCode stats for user: {username}")
+    try:
+        leetcode_collector = LeetCodeStatsCollector(username)
+        leetcode_stats = leetcode_collector.get_stats()
+        logger.info(f"LeetCode stats collected successfully: {leetcode_stats}")
+        return leetcode_stats
+    except Exception as e:
+        logger.error(f"Failed to collect LeetCode stats: {e}")
+        return {}
+
+
+def _collect_hackerrank(username: Optional[str]) -> Dict:
+    """Collect HackerRank stats if a username is configured"""
+    if not username:
+        logger.warning("HACKERRANK_USERNAME not provided, skipping HackerRank stats")
+        return {}
+    
+    logger.info(f"Collecting HackerRank stats for user: {username}")
+    try:
+        hackerrank_collector = HackerRankStatsCollector(username)
+        hackerrank_stats = hackerrank_collector.get_stats()
+        logger.info(f"HackerRank stats collected successfully: {hackerrank_stats}")
+        return hackerrank_stats
+    except Exception as e:
+        logger.error(f"Failed to collect HackerRank stats: {e}")
+        return {}
+
+
 def main():
     """Main function to orchestrate the stats collection and README update"""
     logger.info("Starting README stats update...")
@@ -564,52 +855,14 @@ def main():
         logger.error("TOKEN_GITHUB and GITHUB_USERNAME are required!")
         return
     
-    # Collect GitHub stats
-    logger.info(f"Collecting GitHub stats for user: {github_username}")
-    github_collector = GitHubStatsCollector(github_token, github_username)
-    
-    try:
-        github_stats = {
-            'total_commits': github_collector.get_total_commits(),
-            'total_stars': github_collector.get_total_stars(),
-            'languages': github_collector.get_language_stats()
-        }
-        logger.info(f"GitHub stats collected successfully: {github_stats}")
-    except Exception as e:
-        logger.error(f"Failed to collect GitHub stats: {e}")
-        github_stats = {
-            'total_commits': 0,
-            'total_stars': 0,
-            'languages': {}
-        }
-    
-    # Collect LeetCode stats
-    leetcode_stats = {}
-    if leetcode_username:
-        logger.info(f"Collecting LeetCode stats for user: {leetcode_username}")
-        try:
-            leetcode_collector = LeetCodeStatsCollector(leetcode_username)
-            leetcode_stats = leetcode_collector.get_stats()
-            logger.info(f"LeetCode stats collected successfully: {leetcode_stats}")
-        except Exception as e:
-            logger.error(f"Failed to collect LeetCode stats: {e}")
-            leetcode_stats = {}
-    else:
-        logger.warning("LEETCODE_USERNAME not provided, skipping LeetCode stats")
-    
-    # Collect HackerRank stats  
-    hackerrank_stats = {}
-    if hackerrank_username:
-        logger.info(f"Collecting HackerRank stats for user: {hackerrank_username}")
-        try:
-            hackerrank_collector = HackerRankStatsCollector(hackerrank_username)
-            hackerrank_stats = hackerrank_collector.get_stats()
-            logger.info(f"HackerRank stats collected successfully: {hackerrank_stats}")
-        except Exception as e:
-            logger.error(f"Failed to collect HackerRank stats: {e}")
-            hackerrank_stats = {}
-    else:
-        logger.warning("HACKERRANK_USERNAME not provided, skipping HackerRank stats")
+    # The three platforms are independent hosts, so collect from them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        github_future = executor.submit(_collect_github, github_token, github_username)
+        leetcode_future = executor.submit(_collect_leetcode, leetcode_username)
+        hackerrank_future = executor.submit(_collect_hackerrank, hackerrank_username)
+        github_stats = github_future.result()
+        leetcode_stats = leetcode_future.result()
+        hackerrank_stats = hackerrank_future.result()
     
     # Update README
     logger.info("Updating README.md with collected stats...")
@@ -620,7 +873,8 @@ def main():
     logger.info("=" * 50)
     logger.info("STATS COLLECTION SUMMARY:")
     logger.info(f"GitHub - Commits: {github_stats.get('total_commits', 0)}, Stars: {github_stats.get('total_stars', 0)}")
-    logger.info(f"Languages: {list(github_stats.get('languages', {}).keys())[:3]}")
+    logger.info(f"Current Streak: {github_stats.get('contribution_streak', 0)} days")
+    logger.info(f"Languages: {list(github_stats.get('languages', {}).keys())[:TOP_LANGUAGES]}")
     logger.info(f"LeetCode - Problems: {leetcode_stats.get('total_solved', 0)}")
     logger.info(f"HackerRank - Badges: {hackerrank_stats.get('badges', 0)}")
     logger.info("=" * 50)